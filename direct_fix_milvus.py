@@ -6,6 +6,17 @@ from pymilvus import (
     DataType,
     Collection,
 )
+import numpy as np
+
+# Must match the embedding model output: Titan v2
+# (amazon.titan-embed-text-v2:0) returns 1024-dim vectors, matching
+# this schema; Titan v1 returns 1536 and would fail insert validation.
+EMBEDDING_DIM = 1024
+
+# HNSW search beam width for the post-setup test query. Lower values
+# roughly halve latency per halving with a small recall cost; raise it
+# if recall on real queries looks poor.
+SEARCH_EF = 64
 
 def reset_milvus():
     print("=== Starting Direct Milvus Reset Process ===")
@@ -21,7 +32,14 @@ def reset_milvus():
         connections.connect(
             alias="default",
             uri=milvus_uri,
-            token=milvus_token
+            token=milvus_token,
+            # Keepalive overrides must be passed as a grpc_options dict
+            # (pymilvus >= 2.6.12; older versions silently ignore the
+            # kwarg, as they do bare keepalive_time_ms-style kwargs)
+            grpc_options={
+                "grpc.keepalive_time_ms": 30000,
+                "grpc.keepalive_timeout_ms": 10000
+            }
         )
         print("Connected to Milvus successfully")
         
@@ -40,7 +58,9 @@ def reset_milvus():
             FieldSchema(name="id", dtype=DataType.INT64, is_primary=True, auto_id=True),
             FieldSchema(name="doc_id", dtype=DataType.VARCHAR, max_length=256),
             FieldSchema(name="text", dtype=DataType.VARCHAR, max_length=65535),
-            FieldSchema(name="embedding", dtype=DataType.FLOAT_VECTOR, dim=1024),
+            # fp16 storage halves both segment memory and scan bandwidth
+            # (needs pymilvus >= 2.4 and fp16 support on the Zilliz tier)
+            FieldSchema(name="embedding", dtype=DataType.FLOAT16_VECTOR, dim=EMBEDDING_DIM),
             FieldSchema(name="metadata", dtype=DataType.JSON)
         ]
         
@@ -52,10 +72,16 @@ def reset_milvus():
         print(f"Created collection {collection_name} with new schema")
         
         # Create index
+        # The API issues one query at a time (nq=1), which is HNSW's best
+        # case: graph traversal is logarithmic in collection size, while IVF
+        # variants pay a full scan of every probed list per query.
+        # IP over L2-normalized embeddings gives cosine ranking and skips
+        # the self-term of the L2 distance kernel. Vectors must be unit-
+        # normalized on the ingest side for the scores to be meaningful.
         index_params = {
-            "metric_type": "L2",
-            "index_type": "IVF_FLAT",
-            "params": {"nlist": 1024}
+            "metric_type": "IP",
+            "index_type": "HNSW",
+            "params": {"M": 32, "efConstruction": 200}
         }
         
         collection.create_index("embedding", index_params)
@@ -65,8 +91,10 @@ def reset_milvus():
         collection.load()
         
         # Run a simple query to test
-        search_params = {"metric_type": "L2", "params": {"nprobe": 10}}
-        dummy_vector = [0.0] * 1024
+        search_params = {"metric_type": "IP", "params": {"ef": SEARCH_EF}}
+        # An ndarray lets pymilvus serialize the floats without a per-element
+        # Python-float conversion
+        dummy_vector = np.zeros(EMBEDDING_DIM, dtype=np.float16)
         results = collection.search(
             data=[dummy_vector],
             anns_field="embedding",
@@ -12,7 +12,14 @@ try:
     connections.connect(
         alias="default",
         uri=os.getenv('MILVUS_URI'),
-        token=os.getenv('MILVUS_TOKEN')
+        token=os.getenv('MILVUS_TOKEN'),
+        # Keepalive overrides must be passed as a grpc_options dict
+        # (pymilvus >= 2.6.12; older versions silently ignore the
+        # kwarg, as they do bare keepalive_time_ms-style kwargs)
+        grpc_options={
+            "grpc.keepalive_time_ms": 30000,
+            "grpc.keepalive_timeout_ms": 10000
+        }
     )
     print("Connected to Milvus successfully")
     